@@ -0,0 +1,103 @@
+import base64
+import importlib
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+# The modules use package-relative imports; import the repo as a package the way app.py does
+REPO_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_DIR.parent))
+visualizer = importlib.import_module(f"{REPO_DIR.name}.visualizer")
+Visualizer = visualizer.Visualizer
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def _image_size(img_base64):
+    return Image.open(io.BytesIO(base64.b64decode(img_base64))).size
+
+
+def test_correlation_matrix_all_float_frame(rng):
+    data = pd.DataFrame({'a': rng.random(500), 'b': rng.random(500), 'c': rng.random(500)})
+    result = Visualizer._correlation_matrix(data, ['a', 'b', 'c'])
+    np.testing.assert_allclose(result.to_numpy(), data.corr().to_numpy(), atol=1e-4)
+
+
+def test_correlation_matrix_epoch_millisecond_column(rng):
+    # Millisecond steps are far below float32 resolution at this magnitude
+    ts = 1_700_000_000_000 + np.arange(1000, dtype=np.int64)
+    data = pd.DataFrame({'ts': ts, 'y': np.arange(1000) + rng.normal(size=1000)})
+    result = Visualizer._correlation_matrix(data, ['ts', 'y'])
+    np.testing.assert_allclose(result.to_numpy(), data.corr().to_numpy(), atol=1e-4)
+
+
+def test_data_summary_ignores_unused_categories():
+    data = pd.DataFrame({'c': pd.Categorical(['x', 'y', 'x'], categories=['x', 'y', 'w'])})
+    summary = Visualizer().get_data_summary(data)
+    assert summary['categorical_stats']['c']['unique_values'] == data['c'].nunique() == 2
+
+
+def test_concurrent_visualizations_do_not_mix_images(rng):
+    data = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.normal(size=300),
+                         'cat': rng.choice(list('ABC'), 300)})
+    configs = [('scatter', 'a', 'b'), ('bar', 'cat', 'a'), ('hist', 'a', None), ('box', 'cat', 'b')] * 3
+    expected = [Visualizer().create_visualization(data, *cfg) for cfg in configs]
+
+    shared = Visualizer()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda cfg: shared.create_visualization(data, *cfg), configs))
+    assert results == expected
+
+
+def test_partition_columns_counts_timedelta_as_numeric():
+    data = pd.DataFrame({'n': [1.0, 2.0], 'td': pd.to_timedelta([1, 2], unit='s'),
+                         'flag': [True, False], 'when': pd.to_datetime(['2024-01-01', '2024-01-02']),
+                         'cat': pd.Categorical(['x', 'y']), 'text': pd.Series(['a', 'b'], dtype=object),
+                         'period': pd.period_range('2024-01', periods=2, freq='M')})
+    numeric, categorical, datetime = Visualizer._partition_columns(data)
+    assert numeric == data.select_dtypes(include=['number']).columns.tolist() == ['n', 'td']
+    assert categorical == ['cat', 'text']
+    assert datetime == ['when']
+
+
+def test_figure_size_changes_apply_after_first_plot(rng):
+    data = pd.DataFrame({'a': rng.normal(size=100)})
+    v = Visualizer()
+    sizes = []
+    for figure_size in [(10, 6), (4, 3)]:
+        v.figure_size = figure_size
+        sizes.append(_image_size(v.create_visualization(data, 'hist', 'a')))
+    assert sizes == [(1000, 600), (400, 300)]
+
+
+def test_parallel_visualizations_match_serial(rng):
+    data = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.normal(size=300)})
+    configs = [{'viz_type': 'scatter', 'x_column': 'a', 'y_column': 'b', 'title': f'Plot {i}'}
+               for i in range(visualizer.PARALLEL_MIN_VISUALIZATIONS)]
+
+    v = Visualizer()
+    v.figure_size = (4, 3)
+    v.context = 'paper'
+    serial = v.create_multiple_visualizations(data, [dict(c) for c in configs], max_workers=1)
+    parallel = v.create_multiple_visualizations(data, [dict(c) for c in configs], max_workers=2)
+    assert len(serial) == len(configs)
+    assert parallel == serial
+    assert _image_size(parallel[0]) == (400, 300)
+
+
+def test_sample_points_keeps_row_order():
+    # Descending index: row order and index order differ
+    data = pd.DataFrame({'a': np.arange(1000)}, index=np.arange(1000)[::-1])
+    v = Visualizer(max_points=100)
+    sampled = v._sample_points(data)
+    assert len(sampled) == 100
+    assert sampled['a'].is_monotonic_increasing
@@ -1,12 +1,68 @@
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
 import seaborn as sns
 import pandas as pd
 import numpy as np
 import io
-import base64
+import os
+import pickle
+import threading
+try:
+    # SIMD-accelerated drop-in for the stdlib encoder, used when installed
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Union, Optional, Tuple, Any
 from .llm_integration import LLMIntegration
 
+# Below this many plots the cost of spinning up worker processes outweighs
+# the rendering time saved, so create_multiple_visualizations stays serial
+PARALLEL_MIN_VISUALIZATIONS = 4
+
+# Raster formats _fig_to_base64 can emit, with Pillow encoder options for each
+IMAGE_FORMAT_OPTIONS = {
+    'png': {'compress_level': 3, 'optimize': False},
+    'jpeg': {'quality': 85},
+}
+
+# Plot types drawn with only a handful of flat colors; their PNGs are reduced
+# to a small palette, which shrinks the payload several times over
+QUANTIZE_VIZ_TYPES = {'bar', 'pie', 'box'}
+PALETTE_COLORS = 64
+
+# Instance attributes that affect rendered output; copied onto pool workers so
+# parallel and serial rendering produce the same images
+RENDER_ATTRIBUTES = ('style', 'context', 'palette', 'figure_size', 'image_format', 'max_points')
+
+# Per-worker state populated by _init_render_worker
+_worker_visualizer = None
+_worker_data = None
+
+
+def _init_render_worker(data_bytes: bytes, render_settings: Dict[str, Any]):
+    """Load the shared DataFrame and a plotting-only Visualizer once per worker process"""
+    global _worker_visualizer, _worker_data
+    _worker_data = pickle.loads(data_bytes)
+    _worker_visualizer = Visualizer()
+    for name, value in render_settings.items():
+        setattr(_worker_visualizer, name, value)
+
+
+def _render_one(cfg: Tuple) -> Optional[str]:
+    """Render a single (viz_type, x_column, y_column, title, kwargs) config in a worker process"""
+    viz_type, x_column, y_column, title, kwargs = cfg
+    try:
+        return _worker_visualizer.create_visualization(
+            _worker_data, viz_type, x_column, y_column, title, **kwargs
+        )
+    except Exception as e:
+        print(f"Error creating visualization: {str(e)}")
+        return None
+
+
 class Visualizer:
     """
     A class to generate visualizations from data analysis results.
@@ -14,13 +70,33 @@ class Visualizer:
     Can create dashboards from BigQuery results.
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None, openai_api_endpoint: Optional[str] = None):
+    def __init__(self, openai_api_key: Optional[str] = None, openai_api_endpoint: Optional[str] = None,
+                 image_format: str = 'png', max_points: Optional[int] = 50000):
         # Set default styling
         self.style = 'whitegrid'
         self.context = 'talk'
         self.palette = 'viridis'
         self.figure_size = (10, 6)
-        self._setup_styling()
+        # Styling and the figure are set up on the first plot; recommendation-only
+        # callers never pay for rc parsing and font-manager initialization
+        self._styled = False
+        
+        # Output raster format; 'jpeg' encodes much faster than 'png' for dense plots
+        if image_format not in IMAGE_FORMAT_OPTIONS:
+            raise ValueError(f"Image format '{image_format}' not supported")
+        self.image_format = image_format
+        
+        # Scatter and line plots are drawn from a random sample above this many rows (None disables)
+        self.max_points = max_points
+        
+        # Single figure/canvas reused across plots; created lazily, cleared before each render
+        self._fig = None
+        self._canvas = None
+        
+        # Encode buffers kept for the Visualizer's lifetime so their storage is reused between plots
+        self._img_buf = io.BytesIO()
+        self._raw_buf = io.BytesIO()
+        self._render_lock = threading.Lock()
         
         # Initialize LLM integration if credentials are provided
         self.llm = None
@@ -36,6 +112,10 @@ class Visualizer:
         sns.set_style(self.style)
         sns.set_context(self.context)
         plt.rcParams['figure.figsize'] = self.figure_size
+        # Drop sub-pixel vertices and draw long paths in chunks to speed up dense line plots
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        plt.rcParams['agg.path.chunksize'] = 10000
         
     def set_llm_credentials(self, api_key: str, api_endpoint: str):
         """
@@ -78,96 +158,147 @@ class Visualizer:
         title : str
             Title of the plot
         **kwargs : dict
-            Additional parameters for the specific visualization
+            Additional parameters for the specific visualization.
+            image_format ('png' or 'jpeg') overrides the instance default for this plot
             
         Returns:
         --------
         str
             Base64 encoded image string for HTML embedding
         """
-        plt.figure(figsize=self.figure_size)
-        
-        if viz_type.lower() == 'line':
-            self._create_line_plot(data, x_column, y_column, title, **kwargs)
-        elif viz_type.lower() == 'bar':
-            self._create_bar_plot(data, x_column, y_column, title, **kwargs)
-        elif viz_type.lower() == 'scatter':
-            self._create_scatter_plot(data, x_column, y_column, title, **kwargs)
-        elif viz_type.lower() == 'hist':
-            self._create_histogram(data, x_column, title, **kwargs)
-        elif viz_type.lower() == 'box':
-            self._create_box_plot(data, x_column, y_column, title, **kwargs)
-        elif viz_type.lower() == 'heatmap':
-            self._create_heatmap(data, title, **kwargs)
-        elif viz_type.lower() == 'pie':
-            self._create_pie_chart(data, x_column, y_column, title, **kwargs)
-        else:
-            raise ValueError(f"Visualization type '{viz_type}' not supported")
-        
-        # Convert plot to base64 for HTML embedding
-        return self._fig_to_base64()
+        # The figure and encode buffers are shared, so concurrent callers (e.g. threaded
+        # Flask requests on one Visualizer) must draw and encode one at a time
+        with self._render_lock:
+            image_format = kwargs.pop('image_format', self.image_format)
+            if image_format not in IMAGE_FORMAT_OPTIONS:
+                raise ValueError(f"Image format '{image_format}' not supported")
+            
+            if not self._styled:
+                self._setup_styling()
+                # constrained_layout fits titles and labels during the one draw pass
+                self._fig = Figure(figsize=self.figure_size, constrained_layout=True)
+                self._canvas = FigureCanvasAgg(self._fig)
+                self._styled = True
+            
+            self._fig.clf()
+            # Re-apply the size each time so later changes to figure_size take effect
+            self._fig.set_size_inches(self.figure_size)
+            ax = self._fig.add_subplot(111)
+            
+            if viz_type.lower() == 'line':
+                self._create_line_plot(ax, data, x_column, y_column, title, **kwargs)
+            elif viz_type.lower() == 'bar':
+                self._create_bar_plot(ax, data, x_column, y_column, title, **kwargs)
+            elif viz_type.lower() == 'scatter':
+                self._create_scatter_plot(ax, data, x_column, y_column, title, **kwargs)
+            elif viz_type.lower() == 'hist':
+                self._create_histogram(ax, data, x_column, title, **kwargs)
+            elif viz_type.lower() == 'box':
+                self._create_box_plot(ax, data, x_column, y_column, title, **kwargs)
+            elif viz_type.lower() == 'heatmap':
+                self._create_heatmap(ax, data, title, **kwargs)
+            elif viz_type.lower() == 'pie':
+                self._create_pie_chart(ax, data, x_column, y_column, title, **kwargs)
+            else:
+                raise ValueError(f"Visualization type '{viz_type}' not supported")
+            
+            # Convert plot to base64 for HTML embedding
+            return self._fig_to_base64(image_format=image_format,
+                                       quantize=viz_type.lower() in QUANTIZE_VIZ_TYPES)
     
-    def _fig_to_base64(self) -> str:
-        """Convert matplotlib figure to base64 encoded string for HTML embedding"""
-        img_buf = io.BytesIO()
-        plt.savefig(img_buf, format='png', bbox_inches='tight')
+    def _fig_to_base64(self, image_format: str = 'png', quantize: bool = False) -> str:
+        """
+        Convert the shared figure to base64 encoded string for HTML embedding
+
+        The PNG is written with a lower zlib compression level than the libpng
+        default (6), which is markedly faster to encode for flat-colored plots
+        at the cost of a slightly larger payload. JPEG output goes through
+        Pillow's libjpeg(-turbo) encoder at quality 85. With ``quantize`` a PNG is
+        reduced to a PALETTE_COLORS palette before encoding. The figure is laid out
+        by constrained_layout, so no ``bbox_inches='tight'`` re-render is needed.
+        """
+        # Overwrite the previous image in place, then cut off any leftover tail
+        img_buf = self._img_buf
         img_buf.seek(0)
-        img_base64 = base64.b64encode(img_buf.getvalue()).decode('utf-8')
-        plt.close()
+        if quantize and image_format == 'png':
+            # Render uncompressed, then re-encode the paletted image
+            raw_buf = self._raw_buf
+            raw_buf.seek(0)
+            self._fig.savefig(raw_buf, format='png', pil_kwargs={'compress_level': 0})
+            raw_buf.truncate()
+            raw_buf.seek(0)
+            with Image.open(raw_buf) as img:
+                paletted = img.quantize(colors=PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+            paletted.save(img_buf, format='PNG', **IMAGE_FORMAT_OPTIONS['png'])
+        else:
+            self._fig.savefig(img_buf, format=image_format, pil_kwargs=IMAGE_FORMAT_OPTIONS[image_format])
+        img_buf.truncate()
+        # Encode straight from the buffer's memory rather than a getvalue() copy
+        with img_buf.getbuffer() as png_view:
+            img_base64 = b64encode(png_view).decode('ascii')
         return img_base64
     
-    def _create_line_plot(self, data: pd.DataFrame, x_column: str, y_column: str, 
+    def _sample_points(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Downsample frames larger than max_points; extra overlapping points add render time but no visible detail"""
+        if self.max_points and len(data) > self.max_points:
+            # Sorted positions keep the original row order, which unsorted line plots depend on
+            positions = np.random.default_rng(0).choice(len(data), size=self.max_points, replace=False)
+            return data.iloc[np.sort(positions)]
+        return data
+    
+    def _create_line_plot(self, ax, data: pd.DataFrame, x_column: str, y_column: str, 
                          title: str, **kwargs):
         """Create a line plot"""
-        sns.lineplot(data=data, x=x_column, y=y_column, **kwargs)
-        plt.title(title)
-        plt.tight_layout()
+        data = self._sample_points(data)
+        # Skip the bootstrapped confidence band unless explicitly requested
+        kwargs.setdefault('errorbar', None)
+        sns.lineplot(data=data, x=x_column, y=y_column, ax=ax, **kwargs)
+        ax.set_title(title)
     
-    def _create_bar_plot(self, data: pd.DataFrame, x_column: str, y_column: str, 
+    def _create_bar_plot(self, ax, data: pd.DataFrame, x_column: str, y_column: str, 
                         title: str, **kwargs):
         """Create a bar plot"""
-        sns.barplot(data=data, x=x_column, y=y_column, **kwargs)
-        plt.title(title)
-        plt.xticks(rotation=45 if len(data) > 5 else 0)
-        plt.tight_layout()
+        kwargs.setdefault('errorbar', None)
+        sns.barplot(data=data, x=x_column, y=y_column, ax=ax, **kwargs)
+        ax.set_title(title)
+        ax.tick_params(axis='x', labelrotation=45 if len(data) > 5 else 0)
     
-    def _create_scatter_plot(self, data: pd.DataFrame, x_column: str, y_column: str, 
+    def _create_scatter_plot(self, ax, data: pd.DataFrame, x_column: str, y_column: str, 
                             title: str, **kwargs):
         """Create a scatter plot"""
+        data = self._sample_points(data)
         hue = kwargs.pop('hue', None)
-        sns.scatterplot(data=data, x=x_column, y=y_column, hue=hue, **kwargs)
-        plt.title(title)
-        plt.tight_layout()
+        sns.scatterplot(data=data, x=x_column, y=y_column, hue=hue, ax=ax, **kwargs)
+        ax.set_title(title)
     
-    def _create_histogram(self, data: pd.DataFrame, column: str, title: str, **kwargs):
+    def _create_histogram(self, ax, data: pd.DataFrame, column: str, title: str, **kwargs):
         """Create a histogram"""
         bins = kwargs.pop('bins', 10)
-        sns.histplot(data=data, x=column, bins=bins, **kwargs)
-        plt.title(title)
-        plt.tight_layout()
+        sns.histplot(data=data, x=column, bins=bins, ax=ax, **kwargs)
+        ax.set_title(title)
     
-    def _create_box_plot(self, data: pd.DataFrame, x_column: str, y_column: str, 
+    def _create_box_plot(self, ax, data: pd.DataFrame, x_column: str, y_column: str, 
                         title: str, **kwargs):
         """Create a box plot"""
-        sns.boxplot(data=data, x=x_column, y=y_column, **kwargs)
-        plt.title(title)
-        plt.xticks(rotation=45 if len(data[x_column].unique()) > 5 else 0)
-        plt.tight_layout()
+        sns.boxplot(data=data, x=x_column, y=y_column, ax=ax, **kwargs)
+        ax.set_title(title)
+        ax.tick_params(axis='x', labelrotation=45 if len(data[x_column].unique()) > 5 else 0)
     
-    def _create_heatmap(self, data: pd.DataFrame, title: str, **kwargs):
+    def _create_heatmap(self, ax, data: pd.DataFrame, title: str, **kwargs):
         """Create a heatmap"""
-        sns.heatmap(data, annot=kwargs.pop('annot', True), cmap=kwargs.pop('cmap', 'viridis'), **kwargs)
-        plt.title(title)
-        plt.tight_layout()
+        sns.heatmap(data, annot=kwargs.pop('annot', True), cmap=kwargs.pop('cmap', 'viridis'), ax=ax, **kwargs)
+        ax.set_title(title)
     
-    def _create_pie_chart(self, data: pd.DataFrame, label_column: str, value_column: str, 
+    def _create_pie_chart(self, ax, data: pd.DataFrame, label_column: str, value_column: str, 
                          title: str, **kwargs):
         """Create a pie chart"""
         # Group data if needed
         if len(data) > 10:  # Limit pie slices for readability
             top_n = kwargs.pop('top_n', 5)
-            grouped_data = data.groupby(label_column)[value_column].sum().nlargest(top_n)
-            other_value = data.groupby(label_column)[value_column].sum().sum() - grouped_data.sum()
+            # Key order is irrelevant before nlargest, so skip sorting the (possibly many) labels
+            grouped_all = data.groupby(label_column, sort=False, observed=True)[value_column].sum()
+            grouped_data = grouped_all.nlargest(top_n)
+            other_value = grouped_all.sum() - grouped_data.sum()
             
             # Add "Other" category if needed
             if other_value > 0:
@@ -179,15 +310,20 @@ class Visualizer:
             labels = data[label_column]
             values = data[value_column]
         
-        plt.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, **kwargs)
-        plt.axis('equal')
-        plt.title(title)
+        ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, **kwargs)
+        ax.axis('equal')
+        ax.set_title(title)
         
     def create_multiple_visualizations(self, data: pd.DataFrame, 
-                                     visualizations: List[Dict]) -> List[str]:
+                                     visualizations: List[Dict],
+                                     max_workers: Optional[int] = None) -> List[str]:
         """
         Create multiple visualizations based on configuration and return as list of base64 images
         
+        Plots are rendered in a process pool when there are at least
+        PARALLEL_MIN_VISUALIZATIONS of them; the DataFrame is pickled once and
+        handed to each worker at startup rather than with every task.
+        
         Parameters:
         -----------
         data : pandas.DataFrame
@@ -195,22 +331,40 @@ class Visualizer:
         visualizations : List[Dict]
             List of visualization configurations
             Each dict should have keys: viz_type, x_column, y_column, title, etc.
+        max_workers : int, optional
+            Number of worker processes. Defaults to the CPU count; 1 forces serial rendering
             
         Returns:
         --------
         List[str]
             List of base64 encoded image strings for HTML embedding
         """
-        results = []
+        configs = []
         for viz_config in visualizations:
             viz_type = viz_config.pop('viz_type')
             x_column = viz_config.pop('x_column', None)
             y_column = viz_config.pop('y_column', None)
             title = viz_config.pop('title', f"{viz_type.capitalize()} Visualization")
-            
+            configs.append((viz_type, x_column, y_column, title, viz_config))
+        
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers > 1 and len(configs) >= PARALLEL_MIN_VISUALIZATIONS:
+            try:
+                data_bytes = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+                render_settings = {name: getattr(self, name) for name in RENDER_ATTRIBUTES}
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(configs)),
+                                         initializer=_init_render_worker,
+                                         initargs=(data_bytes, render_settings)) as executor:
+                    rendered = list(executor.map(_render_one, configs))
+                return [img for img in rendered if img is not None]
+            except Exception as e:
+                print(f"Error rendering visualizations in parallel, falling back to serial: {str(e)}")
+        
+        results = []
+        for viz_type, x_column, y_column, title, kwargs in configs:
             try:
                 img_base64 = self.create_visualization(
-                    data, viz_type, x_column, y_column, title, **viz_config
+                    data, viz_type, x_column, y_column, title, **kwargs
                 )
                 results.append(img_base64)
             except Exception as e:
@@ -219,7 +373,35 @@ class Visualizer:
                 
         return results
     
-    def get_recommended_visualizations(self, data: pd.DataFrame) -> List[Dict]:
+    @staticmethod
+    def _partition_columns(data: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Split columns into numeric, categorical and datetime lists in a single pass over the dtypes
+        
+        Parameters:
+        -----------
+        data : pandas.DataFrame
+            The data to inspect
+            
+        Returns:
+        --------
+        Tuple[List[str], List[str], List[str]]
+            Numeric (including timedelta, as select_dtypes('number')), categorical
+            (object, category and string) and datetime column names
+        """
+        # Vectorized masks over dtype kinds rather than per-column select_dtypes checks
+        kinds = np.array([dtype.kind for dtype in data.dtypes], dtype='U1')
+        cols = data.columns.to_numpy()
+        numeric_columns = cols[np.isin(kinds, ['i', 'u', 'f', 'c', 'm'])].tolist()
+        # Other object-kind extension dtypes (Period, Interval, db-dtypes dates/times) are not categorical
+        categorical_mask = np.array([dtype == object or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+                                     for dtype in data.dtypes], dtype=bool)
+        categorical_columns = cols[categorical_mask].tolist()
+        datetime_columns = cols[kinds == 'M'].tolist()
+        return numeric_columns, categorical_columns, datetime_columns
+    
+    def get_recommended_visualizations(self, data: pd.DataFrame,
+                                       columns: Optional[Tuple[List[str], List[str], List[str]]] = None) -> List[Dict]:
         """
         Recommend visualizations based on the data structure and content
         
@@ -227,6 +409,8 @@ class Visualizer:
         -----------
         data : pandas.DataFrame
             The data to analyze
+        columns : tuple, optional
+            Precomputed (numeric, categorical, datetime) column lists from _partition_columns
             
         Returns:
         --------
@@ -236,7 +420,7 @@ class Visualizer:
         # Try to use LLM-based recommendations if available
         if self.llm:
             try:
-                data_summary = self.get_data_summary(data)
+                data_summary = self.get_data_summary(data, columns)
                 llm_recommendations = self.llm.get_visualization_recommendations(data_summary)
                 
                 # Validate and fix recommendations
@@ -259,9 +443,11 @@ class Visualizer:
         
         # Use original rule-based recommendations
         recommendations = []
-        numeric_columns = data.select_dtypes(include=['number']).columns.tolist()
-        categorical_columns = data.select_dtypes(include=['object', 'category']).columns.tolist()
-        datetime_columns = [col for col in data.columns if pd.api.types.is_datetime64_any_dtype(data[col])]
+        if columns is None:
+            columns = self._partition_columns(data)
+        numeric_columns, categorical_columns, datetime_columns = columns
+        # Distinct counts for every categorical column in one vectorized pass
+        categorical_nunique = data[categorical_columns].nunique()
         
         # Original recommendation logic
         if datetime_columns and numeric_columns:
@@ -274,8 +460,7 @@ class Visualizer:
         
         if categorical_columns and numeric_columns:
             cat_col = None
-            for col in categorical_columns:
-                unique_vals = data[col].nunique()
+            for col, unique_vals in categorical_nunique.items():
                 if 2 <= unique_vals <= 15:
                     cat_col = col
                     break
@@ -326,8 +511,7 @@ class Visualizer:
                     'title': f'Distribution of {col}'
                 })
         
-        for col in categorical_columns:
-            unique_vals = data[col].nunique()
+        for col, unique_vals in categorical_nunique.items():
             if 2 <= unique_vals <= 10:
                 value_col = numeric_columns[0] if numeric_columns else None
                 if value_col:
@@ -348,6 +532,42 @@ class Visualizer:
         
         return recommendations
     
+    @staticmethod
+    def _correlation_matrix(data: pd.DataFrame, numeric_columns: List[str]) -> pd.DataFrame:
+        """
+        Pearson correlation of the numeric columns, computed in float32
+        
+        pandas' DataFrame.corr always upcasts to float64 and loops over column
+        pairs; when there are no missing values the matrix is instead taken
+        from a single float32 matrix product of the centered columns. Columns
+        are centered in float64 first so large-magnitude values (e.g. epoch
+        milliseconds) keep their low digits. Frames with missing values fall
+        back to pandas for pairwise-complete handling.
+        
+        Parameters:
+        -----------
+        data : pandas.DataFrame
+            The data to correlate
+        numeric_columns : List[str]
+            Columns to include in the matrix
+            
+        Returns:
+        --------
+        pandas.DataFrame
+            Square correlation matrix indexed by column name
+        """
+        values = data[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            return data[numeric_columns].corr(method='pearson')
+        
+        # to_numpy may hand back a read-only view, so center out of place
+        values = (values - values.mean(axis=0)).astype(np.float32)
+        norms = np.sqrt(np.einsum('ij,ij->j', values, values))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = (values.T @ values) / np.outer(norms, norms)
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return pd.DataFrame(corr, index=numeric_columns, columns=numeric_columns)
+    
     def create_dashboard(self, data: pd.DataFrame, title: str = "Data Analysis Dashboard") -> Dict[str, Any]:
         """
         Create a complete dashboard from analysis results
@@ -364,20 +584,24 @@ class Visualizer:
         Dict[str, Any]
             Dashboard configuration with visualizations and summary statistics
         """
+        # Classify columns once and share with the summary and recommendations
+        columns = self._partition_columns(data)
+        
         # Get data summary
-        summary = self.get_data_summary(data)
+        summary = self.get_data_summary(data, columns)
         
         # Get recommended visualizations based on data
-        viz_configs = self.get_recommended_visualizations(data)
+        viz_configs = self.get_recommended_visualizations(data, columns)
         
         # Generate all visualizations
         visualizations = []
         for viz_config in viz_configs:
-            viz_data = data.copy()
+            # Plot helpers only read from the frame, so share it unless a transform builds a new one
+            viz_data = data
             if 'data_transform' in viz_config:
                 transform_type = viz_config.pop('data_transform')
                 if transform_type == 'correlation':
-                    viz_data = data.select_dtypes(include=['number']).corr()
+                    viz_data = self._correlation_matrix(data, columns[0])
                 elif transform_type == 'count':
                     col = viz_config.get('label_column')
                     if col:
@@ -399,7 +623,8 @@ class Visualizer:
                 visualizations.append({
                     'type': viz_type,
                     'title': title,
-                    'image': img_base64
+                    'image': img_base64,
+                    'format': self.image_format
                 })
             except Exception as e:
                 print(f"Error creating visualization: {str(e)}")
@@ -422,7 +647,8 @@ class Visualizer:
         
         return dashboard
     
-    def get_data_summary(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def get_data_summary(self, data: pd.DataFrame,
+                         columns: Optional[Tuple[List[str], List[str], List[str]]] = None) -> Dict[str, Any]:
         """
         Generate summary statistics for the data
         
@@ -430,15 +656,17 @@ class Visualizer:
         -----------
         data : pandas.DataFrame
             The data to analyze
+        columns : tuple, optional
+            Precomputed (numeric, categorical, datetime) column lists from _partition_columns
             
         Returns:
         --------
         Dict[str, Any]
             Summary statistics including shape, column types, and basic descriptive statistics
         """
-        numeric_columns = data.select_dtypes(include=['number']).columns.tolist()
-        categorical_columns = data.select_dtypes(include=['object', 'category']).columns.tolist()
-        datetime_columns = [col for col in data.columns if pd.api.types.is_datetime64_any_dtype(data[col])]
+        if columns is None:
+            columns = self._partition_columns(data)
+        numeric_columns, categorical_columns, datetime_columns = columns
         
         summary = {
             'row_count': len(data),
@@ -452,16 +680,19 @@ class Visualizer:
         }
         
         if numeric_columns:
-            summary['numeric_stats'] = data[numeric_columns].describe().to_dict()
+            # Quartiles are not consumed downstream (pandas < 3 still adds the median regardless)
+            summary['numeric_stats'] = data[numeric_columns].describe(percentiles=[]).to_dict()
         
         if categorical_columns:
             summary['categorical_stats'] = {}
             for col in categorical_columns:
-                top_values = data[col].value_counts().head(5).to_dict()
-                total_unique = data[col].nunique()
+                # One hash pass serves both the distinct count and the top values;
+                # nlargest partially selects the top 5 instead of sorting every distinct value
+                value_counts = data[col].value_counts(sort=False)
                 summary['categorical_stats'][col] = {
-                    'unique_values': total_unique,
-                    'top_values': top_values
+                    # Categoricals list unused categories with a zero count
+                    'unique_values': int((value_counts > 0).sum()),
+                    'top_values': value_counts.nlargest(5).to_dict()
                 }
         
         if datetime_columns: